@@ -1,10 +1,33 @@
 import { defineBackground } from 'wxt/sandbox';
+import type { MatchCacheMessage } from '@/types';
+import { MESSAGE_TYPES } from '@/types';
+import { MatchStore } from '@/utils/match-store';
 
 export default defineBackground({
   main() {
     console.log('WordWise Korean: Background script loaded');
-    
-    // Placeholder for future API calls or background tasks
-    // For MVP, most logic is in content script
+
+    // Persistent match cache — lives here so it stays out of page origins
+    const matchStore = new MatchStore();
+
+    chrome.runtime.onMessage.addListener((message: MatchCacheMessage, _sender, sendResponse) => {
+      if (message?.type === MESSAGE_TYPES.MATCH_CACHE_PRELOAD) {
+        matchStore.loadRecent(message.scope, message.limit).then(sendResponse, (error) => {
+          console.error('WordWise Korean: Failed to load match cache', error);
+          sendResponse([]);
+        });
+        return true; // respond asynchronously
+      }
+
+      if (message?.type === MESSAGE_TYPES.MATCH_CACHE_PUT) {
+        matchStore.put(message.records).then(() => sendResponse(), (error) => {
+          console.error('WordWise Korean: Failed to persist match cache', error);
+          sendResponse();
+        });
+        return true;
+      }
+
+      return false;
+    });
   },
 });
@@ -3,10 +3,14 @@ import type { UserConfig } from '@/types';
 import { DEFAULT_CONFIG, STORAGE_KEYS } from '@/types';
 import { loadVocabulary } from '@/utils/vocabulary-loader';
 import { WordWiseAnnotator } from '@/utils/annotator';
+import { MatchCache } from '@/utils/match-cache';
 import { DOMObserver } from '@/utils/dom-observer';
 
 const KOREAN_RE = /[가-힣]/;
 
+// Longest the first annotation pass waits for persisted match cache entries
+const PRELOAD_TIMEOUT_MS = 50;
+
 export default defineContentScript({
   matches: ['<all_urls>'],
   registration: 'manifest',
@@ -64,8 +68,20 @@ async function initializeFull(): Promise<void> {
     const vocabulary = loadVocabulary(config);
     console.log(`WordWise Korean: Loaded ${vocabulary.size} vocabulary words (Level ${config.level})`);
 
+    // Match cache: __MATCH_CACHE_VERSION__ is a build-time hash of the vocab and
+    // matching sources (see wxt.config.ts). Dev builds stay memory-only so
+    // edits to matching rules are never hidden by matches from earlier builds.
+    const matchCache = new MatchCache({
+      version: __MATCH_CACHE_VERSION__,
+      persist: !import.meta.env.DEV,
+    });
+    await preloadMatches(matchCache, config);
+    window.addEventListener('pagehide', () => {
+      matchCache.flush();
+    });
+
     // Create annotator
-    const annotator = new WordWiseAnnotator(vocabulary, config);
+    const annotator = new WordWiseAnnotator(vocabulary, config, matchCache);
 
     // Inject styles with user's font size preference
     injectStyles(config.fontSize);
@@ -134,8 +150,16 @@ async function initializeFull(): Promise<void> {
           ) {
             annotator.setUpdating(true);
             observer.stop();
+
+            // Highlight alone keeps the cache scope, so only warm it for a new level/language
+            const preloaded =
+              newConfig.level !== oldConfig.level || newConfig.targetLanguage !== oldConfig.targetLanguage
+                ? preloadMatches(matchCache, newConfig)
+                : Promise.resolve();
             
-            setTimeout(() => {
+            setTimeout(async () => {
+              await preloaded;
+
               if (newConfig.level !== oldConfig.level) {
                 const newVocabulary = loadVocabulary(newConfig);
                 console.log(`WordWise Korean: Loaded ${newVocabulary.size} words for Level ${newConfig.level}`);
@@ -161,6 +185,18 @@ async function initializeFull(): Promise<void> {
     console.log('WordWise Korean: Ready');
 }
 
+/**
+ * Warm the match cache with entries from earlier visits, waiting at most
+ * PRELOAD_TIMEOUT_MS so a slow background never holds up annotation.
+ * A late preload still lands (behind anything cached since) for re-renders.
+ */
+function preloadMatches(matchCache: MatchCache, config: UserConfig): Promise<unknown> {
+  return Promise.race([
+    matchCache.preload(config.level, config.targetLanguage),
+    new Promise(resolve => setTimeout(resolve, PRELOAD_TIMEOUT_MS)),
+  ]);
+}
+
 /**
  * Inject CSS styles for ruby tags and annotations
  */
@@ -5,3 +5,6 @@ declare module '*.vue' {
   const component: DefineComponent<{}, {}, any>;
   export default component;
 }
+
+// Build-time hash of the vocab and matching sources (defined in wxt.config.ts)
+declare const __MATCH_CACHE_VERSION__: string;
@@ -0,0 +1,190 @@
+/**
+ * Minimal in-memory IndexedDB for tests (installed with vi.stubGlobal).
+ *
+ * Covers only what MatchStore uses: open + upgrade, object stores with a
+ * keyPath, single/compound indexes, put, count, IDBKeyRange.bound and
+ * index cursors (next/prev, continue, delete). Request callbacks fire as
+ * macrotasks and a transaction completes once no requests are outstanding,
+ * mirroring the auto-commit behaviour of real IndexedDB.
+ */
+
+type Key = number | string | Key[];
+type KeyPath = string | string[];
+type Row = Record<string, any>;
+
+/** IndexedDB key order: number < string < array */
+function compareKeys(a: Key, b: Key): number {
+  const rank = (k: Key) => (Array.isArray(k) ? 3 : typeof k === 'string' ? 2 : 1);
+  if (rank(a) !== rank(b)) return rank(a) - rank(b);
+  if (Array.isArray(a) && Array.isArray(b)) {
+    for (let i = 0; i < Math.min(a.length, b.length); i++) {
+      const c = compareKeys(a[i], b[i]);
+      if (c !== 0) return c;
+    }
+    return a.length - b.length;
+  }
+  return a < b ? -1 : a > b ? 1 : 0;
+}
+
+function keyOf(row: Row, keyPath: KeyPath): Key {
+  return Array.isArray(keyPath) ? keyPath.map(p => row[p]) : row[keyPath];
+}
+
+export class FakeKeyRange {
+  constructor(readonly lower: Key, readonly upper: Key) {}
+
+  static bound(lower: Key, upper: Key): FakeKeyRange {
+    return new FakeKeyRange(lower, upper);
+  }
+
+  includes(key: Key): boolean {
+    return compareKeys(key, this.lower) >= 0 && compareKeys(key, this.upper) <= 0;
+  }
+}
+
+class FakeRequest<T = any> {
+  result!: T;
+  error: Error | null = null;
+  onsuccess: (() => void) | null = null;
+  onerror: (() => void) | null = null;
+  onupgradeneeded: ((event: { oldVersion: number }) => void) | null = null;
+}
+
+class FakeStoreData {
+  rows = new Map<string, Row>();
+  indexes = new Map<string, KeyPath>();
+  constructor(readonly keyPath: string) {}
+}
+
+class FakeDatabase {
+  version = 0;
+  stores = new Map<string, FakeStoreData>();
+
+  get objectStoreNames() {
+    return { contains: (name: string) => this.stores.has(name) };
+  }
+
+  createObjectStore(name: string, options: { keyPath: string }) {
+    if (this.stores.has(name)) throw new Error(`ConstraintError: store ${name} exists`);
+    const data = new FakeStoreData(options.keyPath);
+    this.stores.set(name, data);
+    return {
+      createIndex: (indexName: string, keyPath: KeyPath) => {
+        if (data.indexes.has(indexName)) throw new Error(`ConstraintError: index ${indexName} exists`);
+        data.indexes.set(indexName, keyPath);
+      },
+    };
+  }
+
+  transaction(name: string) {
+    return new FakeTransaction(this, name);
+  }
+}
+
+class FakeTransaction {
+  oncomplete: (() => void) | null = null;
+  onerror: (() => void) | null = null;
+  onabort: (() => void) | null = null;
+  error: Error | null = null;
+  private outstanding = 0;
+
+  constructor(private db: FakeDatabase, private storeName: string) {
+    this.scheduleCommit();
+  }
+
+  objectStore(name: string) {
+    if (name !== this.storeName) throw new Error(`NotFoundError: ${name} not in transaction`);
+    const data = this.db.stores.get(name)!;
+    return {
+      put: (row: Row) => this.request(() => {
+        const key = String(row[data.keyPath]);
+        data.rows.set(key, structuredClone(row));
+        return key;
+      }),
+      count: () => this.request(() => data.rows.size),
+      index: (indexName: string) => ({
+        openCursor: (range?: FakeKeyRange, direction: 'next' | 'prev' = 'next') =>
+          this.openCursor(data, data.indexes.get(indexName)!, range, direction),
+      }),
+    };
+  }
+
+  /** Fire a request's success callback as a macrotask */
+  private request<T>(run: () => T): FakeRequest<T> {
+    const request = new FakeRequest<T>();
+    this.outstanding++;
+    setTimeout(() => {
+      request.result = run();
+      request.onsuccess?.();
+      this.outstanding--;
+      this.scheduleCommit();
+    });
+    return request;
+  }
+
+  private openCursor(data: FakeStoreData, keyPath: KeyPath, range: FakeKeyRange | undefined, direction: 'next' | 'prev') {
+    const entries = Array.from(data.rows.entries())
+      .map(([primary, row]) => ({ primary, indexKey: keyOf(row, keyPath) }))
+      .filter(e => !range || range.includes(e.indexKey))
+      .sort((a, b) => compareKeys(a.indexKey, b.indexKey) || compareKeys(a.primary, b.primary));
+    if (direction === 'prev') entries.reverse();
+
+    const request = new FakeRequest<any>();
+    let position = -1;
+    const step = () => this.request(() => {
+      do position++;
+      while (position < entries.length && !data.rows.has(entries[position].primary));
+      if (position >= entries.length) return null;
+      const { primary } = entries[position];
+      return {
+        value: structuredClone(data.rows.get(primary)),
+        delete: () => this.request(() => data.rows.delete(primary)),
+        continue: () => forward(),
+      };
+    });
+    const forward = () => {
+      const next = step();
+      next.onsuccess = () => {
+        request.result = next.result;
+        request.onsuccess?.();
+      };
+    };
+    forward();
+    return request;
+  }
+
+  private scheduleCommit(): void {
+    setTimeout(() => {
+      if (this.outstanding === 0 && this.oncomplete) {
+        const done = this.oncomplete;
+        this.oncomplete = null;
+        done();
+      }
+    });
+  }
+}
+
+export class FakeIndexedDB {
+  private databases = new Map<string, FakeDatabase>();
+
+  open(name: string, version: number) {
+    const request = new FakeRequest<FakeDatabase>();
+    setTimeout(() => {
+      const db = this.databases.get(name) ?? new FakeDatabase();
+      this.databases.set(name, db);
+      request.result = db;
+      if (version > db.version) {
+        const oldVersion = db.version;
+        db.version = version;
+        request.onupgradeneeded?.({ oldVersion });
+      }
+      request.onsuccess?.();
+    });
+    return request;
+  }
+
+  /** Raw rows of a store, for assertions */
+  rows(dbName: string, storeName: string): Row[] {
+    return Array.from(this.databases.get(dbName)?.stores.get(storeName)?.rows.values() ?? []);
+  }
+}
@@ -0,0 +1,221 @@
+/**
+ * Match Cache Tests
+ *
+ * Verifies:
+ *   1. Cache keys are stable and change with text, level, language and version
+ *   2. In-memory LRU get/set and eviction, and where preloaded entries land
+ *   3. Annotator serves repeated text blocks from the cache and falls back to
+ *      a fresh match when a cached entry is stale or does not fit the text
+ *
+ * There is no extension runtime under the node test environment, so most
+ * tests cover the memory-only fallback (preload/flush are no-ops); the
+ * background-store tests stub chrome.runtime.sendMessage.
+ */
+
+import { describe, it, expect, afterEach, vi } from 'vitest';
+import { MatchCache, matchCacheKey, matchCacheScope } from '@/utils/match-cache';
+import { hashString } from '@/utils/hash';
+import { WordWiseAnnotator } from '@/utils/annotator';
+import rawVocab from '@/assets/topik-vocab.json';
+import { DEFAULT_CONFIG, MESSAGE_TYPES } from '@/types';
+import type { VocabEntry, UserConfig, TextReplacement, CachedReplacement, PersistedMatch } from '@/types';
+
+const vocabMap = new Map((rawVocab as VocabEntry[]).map(w => [w.word, w]));
+const config: UserConfig = { ...DEFAULT_CONFIG, level: 3 };
+
+/** Call the annotator's private matcher */
+function find(annotator: WordWiseAnnotator, text: string): TextReplacement[] {
+  return annotator['findReplacements'](text);
+}
+
+// ─── 1. Keys ──────────────────────────────────────────────────────────────────
+
+describe('Cache keys', () => {
+  it('hashString is deterministic', () => {
+    expect(hashString('학교에 가요')).toBe(hashString('학교에 가요'));
+    expect(hashString('학교에 가요')).not.toBe(hashString('학교에 가고'));
+  });
+
+  it('key changes with level, language and version', () => {
+    const text = '친구를 만났어요';
+    const base = matchCacheKey(text, matchCacheScope(3, 'en', 'v1'));
+    expect(matchCacheKey(text, matchCacheScope(3, 'en', 'v1'))).toBe(base);
+    expect(matchCacheKey(text, matchCacheScope(2, 'en', 'v1'))).not.toBe(base);
+    expect(matchCacheKey(text, matchCacheScope(3, 'ja', 'v1'))).not.toBe(base);
+    expect(matchCacheKey(text, matchCacheScope(3, 'en', 'v2'))).not.toBe(base);
+  });
+});
+
+// ─── 2. In-memory LRU ─────────────────────────────────────────────────────────
+
+describe('MatchCache (memory-only)', () => {
+  it('returns stored matches and misses on other settings', async () => {
+    const cache = new MatchCache({ version: 'test' });
+    await cache.preload(3, 'en');
+
+    cache.set('학교', 3, 'en', [[0, 2, '학교']]);
+    expect(cache.get('학교', 3, 'en')).toEqual([[0, 2, '학교']]);
+    expect(cache.get('학교', 3, 'zh')).toBeUndefined();
+    expect(cache.get('학교', 1, 'en')).toBeUndefined();
+  });
+
+  it('caches empty match lists', () => {
+    const cache = new MatchCache({ version: 'test' });
+    cache.set('김철수', 3, 'en', []);
+    expect(cache.get('김철수', 3, 'en')).toEqual([]);
+  });
+
+  it('evicts the least recently used entry beyond memoryLimit', () => {
+    const cache = new MatchCache({ version: 'test', memoryLimit: 2 });
+    cache.set('가', 3, 'en', []);
+    cache.set('나', 3, 'en', []);
+    cache.get('가', 3, 'en'); // 가 is now most recently used
+    cache.set('다', 3, 'en', []);
+
+    expect(cache.size).toBe(2);
+    expect(cache.get('가', 3, 'en')).toBeDefined();
+    expect(cache.get('나', 3, 'en')).toBeUndefined();
+    expect(cache.get('다', 3, 'en')).toBeDefined();
+  });
+});
+
+describe('MatchCache with background store', () => {
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  /** Persisted record for text under level 3 / en / version 'test' */
+  function persisted(text: string, lastUsed: number): PersistedMatch {
+    const scope = matchCacheScope(3, 'en', 'test');
+    return { key: matchCacheKey(text, scope), scope, lastUsed, replacements: [] };
+  }
+
+  /** Stub the background: PRELOAD resolves when the test calls respond() */
+  function stubBackground() {
+    let respond!: (records: PersistedMatch[]) => void;
+    const preloadResponse = new Promise<PersistedMatch[]>(resolve => { respond = resolve; });
+    vi.stubGlobal('chrome', {
+      runtime: {
+        id: 'test',
+        sendMessage: async (message: { type: string }) =>
+          message.type === MESSAGE_TYPES.MATCH_CACHE_PRELOAD ? preloadResponse : undefined,
+      },
+    });
+    return (records: PersistedMatch[]) => respond(records);
+  }
+
+  it('keeps entries cached before a late preload lands', async () => {
+    const respond = stubBackground();
+    const cache = new MatchCache({ version: 'test', memoryLimit: 3 });
+
+    const preloaded = cache.preload(3, 'en');
+    cache.set('가', 3, 'en', []);
+    cache.set('나', 3, 'en', []);
+    // Newest first, as MatchStore.loadRecent returns them
+    respond([persisted('다', 3), persisted('라', 2), persisted('마', 1)]);
+    await preloaded;
+
+    expect(cache.size).toBe(3);
+    expect(cache.get('가', 3, 'en')).toBeDefined();
+    expect(cache.get('나', 3, 'en')).toBeDefined();
+    expect(cache.get('다', 3, 'en')).toBeDefined(); // newest preloaded fills the free slot
+    expect(cache.get('라', 3, 'en')).toBeUndefined();
+    await cache.flush();
+  });
+
+  it('puts preloaded entries at the least recently used end', async () => {
+    const respond = stubBackground();
+    const cache = new MatchCache({ version: 'test', memoryLimit: 3 });
+
+    const preloaded = cache.preload(3, 'en');
+    cache.set('가', 3, 'en', []);
+    respond([persisted('다', 2), persisted('라', 1)]);
+    await preloaded;
+
+    cache.set('나', 3, 'en', []); // evicts the oldest preloaded entry, not 가
+
+    expect(cache.get('가', 3, 'en')).toBeDefined();
+    expect(cache.get('나', 3, 'en')).toBeDefined();
+    expect(cache.get('다', 3, 'en')).toBeDefined();
+    expect(cache.get('라', 3, 'en')).toBeUndefined();
+    await cache.flush();
+  });
+
+  it('forgets refreshed keys once the LRU evicts them', async () => {
+    stubBackground();
+    const cache = new MatchCache({ version: 'test', memoryLimit: 2 });
+
+    for (const text of ['가', '나', '다', '라']) cache.set(text, 3, 'en', []);
+
+    expect(cache['touched'].size).toBe(2);
+    await cache.flush();
+  });
+});
+
+// ─── 3. Annotator integration ─────────────────────────────────────────────────
+
+describe('Annotator with match cache', () => {
+  const text = '친구를 만나서 학교에 갔어요';
+
+  it('produces the same replacements with and without a cache', () => {
+    const plain = new WordWiseAnnotator(vocabMap, config);
+    const cached = new WordWiseAnnotator(vocabMap, config, new MatchCache({ version: 'test' }));
+
+    const expected = find(plain, text);
+    expect(expected.length).toBeGreaterThan(0);
+    expect(find(cached, text)).toEqual(expected); // miss
+    expect(find(cached, text)).toEqual(expected); // hit
+  });
+
+  it('stores compact [start, end, entryId] matches', () => {
+    const cache = new MatchCache({ version: 'test' });
+    const annotator = new WordWiseAnnotator(vocabMap, config, cache);
+    const replacements = find(annotator, text);
+
+    const stored = cache.get(text, config.level, config.targetLanguage);
+    expect(stored).toHaveLength(replacements.length);
+    for (const [start, end, entryId] of stored!) {
+      expect(vocabMap.has(entryId)).toBe(true);
+      expect(end).toBeGreaterThan(start);
+    }
+  });
+
+  it('serves a hit without re-matching', () => {
+    const cache = new MatchCache({ version: 'test' });
+    // Deliberately "wrong" entry: 학교 annotated on the first two syllables
+    cache.set('친구', config.level, config.targetLanguage, [[0, 2, '학교']]);
+    const annotator = new WordWiseAnnotator(vocabMap, config, cache);
+
+    const [replacement] = find(annotator, '친구');
+    expect(replacement.word).toBe('친구');
+    expect(replacement.translation).toBe(find(new WordWiseAnnotator(vocabMap, config), '학교')[0].translation);
+  });
+
+  it('re-matches when a cached entry id is not in the vocabulary', () => {
+    const cache = new MatchCache({ version: 'test' });
+    cache.set('학교', config.level, config.targetLanguage, [[0, 2, '없는단어']]);
+    const annotator = new WordWiseAnnotator(vocabMap, config, cache);
+
+    const replacements = find(annotator, '학교');
+    expect(replacements).toHaveLength(1);
+    expect(cache.get('학교', config.level, config.targetLanguage)).toEqual([[0, 2, '학교']]);
+  });
+
+  it.each([
+    ['out of range', [[3, 6, '학교']]],
+    ['empty range', [[1, 1, '학교']]],
+    ['negative start', [[-1, 2, '학교']]],
+    ['non-integer offsets', [[0.5, 2, '학교']]],
+    ['overlapping', [[0, 2, '학교'], [1, 3, '학교']]],
+    ['unsorted', [[3, 5, '학교'], [0, 2, '학교']]],
+    ['non-Hangul range', [[2, 3, '학교']]],
+  ] as [string, CachedReplacement[]][])('re-matches when a cached entry is %s', (_, stored) => {
+    const cache = new MatchCache({ version: 'test' });
+    cache.set('학교 학교', config.level, config.targetLanguage, stored);
+    const annotator = new WordWiseAnnotator(vocabMap, config, cache);
+
+    const replacements = find(annotator, '학교 학교');
+    expect(replacements.map(r => [r.start, r.end])).toEqual([[0, 2], [3, 5]]);
+    expect(cache.get('학교 학교', config.level, config.targetLanguage)).toEqual([[0, 2, '학교'], [3, 5, '학교']]);
+  });
+});
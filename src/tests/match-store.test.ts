@@ -0,0 +1,111 @@
+/**
+ * Match Store Tests (background IndexedDB side of the match cache)
+ *
+ * Verifies:
+ *   1. loadRecent() returns only the requested scope, newest first, up to limit
+ *   2. put() caps the store at persistLimit, evicting least recently used first
+ *   3. Entries persist across MatchStore instances (page loads)
+ *
+ * Runs against the in-memory IndexedDB in ./helpers/fake-indexeddb.ts.
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { MatchStore } from '@/utils/match-store';
+import type { PersistedMatch } from '@/types';
+import { FakeIndexedDB, FakeKeyRange } from './helpers/fake-indexeddb';
+
+let idb: FakeIndexedDB;
+
+beforeEach(() => {
+  idb = new FakeIndexedDB();
+  vi.stubGlobal('indexedDB', idb);
+  vi.stubGlobal('IDBKeyRange', FakeKeyRange);
+});
+
+afterEach(() => {
+  vi.unstubAllGlobals();
+});
+
+function record(key: string, scope: string, lastUsed: number): PersistedMatch {
+  return { key, scope, lastUsed, replacements: [[0, 2, '학교']] };
+}
+
+const keys = (records: PersistedMatch[]) => records.map(r => r.key);
+
+// ─── 1. Scope filtering ───────────────────────────────────────────────────────
+
+describe('MatchStore.loadRecent', () => {
+  it('returns only the requested scope, most recently used first', async () => {
+    const store = new MatchStore();
+    await store.put([
+      record('a', '3:en:v1', 1),
+      record('b', '3:en:v1', 3),
+      record('c', '3:zh:v1', 2),
+      record('d', '2:en:v1', 4),
+      record('e', '3:en:v2', 5),
+      record('f', '3:en:v1', 2),
+    ]);
+
+    expect(keys(await store.loadRecent('3:en:v1', 10))).toEqual(['b', 'f', 'a']);
+    expect(keys(await store.loadRecent('3:zh:v1', 10))).toEqual(['c']);
+    expect(await store.loadRecent('1:ja:v1', 10)).toEqual([]);
+  });
+
+  it('stops at limit', async () => {
+    const store = new MatchStore();
+    await store.put([1, 2, 3, 4].map(n => record(`k${n}`, 's', n)));
+
+    expect(keys(await store.loadRecent('s', 2))).toEqual(['k4', 'k3']);
+  });
+
+  it('returns the full record', async () => {
+    const store = new MatchStore();
+    await store.put([record('a', 's', 1)]);
+
+    expect(await store.loadRecent('s', 1)).toEqual([record('a', 's', 1)]);
+  });
+});
+
+// ─── 2. Size cap ──────────────────────────────────────────────────────────────
+
+describe('MatchStore.put size cap', () => {
+  it('evicts the least recently used entries across all scopes', async () => {
+    const store = new MatchStore(3);
+    await store.put([
+      record('old', 's1', 1),
+      record('newest', 's2', 5),
+      record('older', 's2', 2),
+      record('mid', 's1', 3),
+      record('new', 's1', 4),
+    ]);
+
+    const remaining = idb.rows('wordwise-korean', 'match-cache').map(r => r.key).sort();
+    expect(remaining).toEqual(['mid', 'new', 'newest']);
+  });
+
+  it('a refreshed lastUsed protects an entry from eviction', async () => {
+    const store = new MatchStore(2);
+    await store.put([record('a', 's', 1), record('b', 's', 2)]);
+    await store.put([record('a', 's', 3)]); // touched again
+    await store.put([record('c', 's', 4)]);
+
+    expect(keys(await store.loadRecent('s', 10))).toEqual(['c', 'a']);
+  });
+
+  it('does not prune below the cap', async () => {
+    const store = new MatchStore(5);
+    await store.put([record('a', 's', 1), record('b', 's', 2)]);
+
+    expect(idb.rows('wordwise-korean', 'match-cache')).toHaveLength(2);
+  });
+});
+
+// ─── 3. Persistence ───────────────────────────────────────────────────────────
+
+describe('MatchStore persistence', () => {
+  it('entries written by one instance are read by the next', async () => {
+    await new MatchStore().put([record('a', 's', 1)]);
+
+    expect(keys(await new MatchStore().loadRecent('s', 10))).toEqual(['a']);
+  });
+});
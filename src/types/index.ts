@@ -31,6 +31,29 @@ export interface TextReplacement {
   translation: string;
 }
 
+/**
+ * Compact form of a TextReplacement stored in the match cache.
+ * entryId is the vocabulary key (VocabEntry.word); the surface word and
+ * translation are re-derived from the text and vocabulary on a cache hit.
+ */
+export type CachedReplacement = [start: number, end: number, entryId: string];
+
+/**
+ * Match cache record persisted by the background script.
+ * scope = level + language + cache version, so preloading can pick only the
+ * entries that match the current settings.
+ */
+export interface PersistedMatch {
+  key: string;
+  scope: string;
+  lastUsed: number;
+  replacements: CachedReplacement[];
+}
+
+export type MatchCacheMessage =
+  | { type: typeof MESSAGE_TYPES.MATCH_CACHE_PRELOAD; scope: string; limit: number }
+  | { type: typeof MESSAGE_TYPES.MATCH_CACHE_PUT; records: PersistedMatch[] };
+
 export const DEFAULT_CONFIG: UserConfig = {
   enabled: true,
   level: 2,
@@ -43,3 +66,9 @@ export const STORAGE_KEYS = {
   CONFIG: 'wordwise_config',
   STATS: 'wordwise_stats',
 } as const;
+
+// Content script → background messages
+export const MESSAGE_TYPES = {
+  MATCH_CACHE_PRELOAD: 'wordwise_match_cache_preload',
+  MATCH_CACHE_PUT: 'wordwise_match_cache_put',
+} as const;
@@ -1,6 +1,7 @@
-import type { VocabEntry, UserConfig, TextReplacement } from '@/types';
+import type { VocabEntry, UserConfig, TextReplacement, CachedReplacement } from '@/types';
 import { getTranslation } from './vocabulary-loader';
 import { extractStemsForLookup, VERB_POS } from './korean-stem';
+import type { MatchCache } from './match-cache';
 
 // Tags to skip during annotation
 const SKIP_TAGS = new Set([
@@ -19,6 +20,9 @@ const SKIP_TAGS = new Set([
 const ANNOTATION_CLASS = 'word-wise-korean';
 const HIGHLIGHT_CLASS = 'word-wise-highlight';
 
+// A matched range must be a run of Hangul syllables (see findMatches)
+const HANGUL_WORD = /^[가-힣]+$/;
+
 /**
  * Main annotator class that processes text nodes and adds ruby tags
  */
@@ -27,10 +31,16 @@ export class WordWiseAnnotator {
   private config: UserConfig;
   private processedNodes = new WeakSet<Node>();
   private isUpdating = false; // Flag to prevent processing during updates
+  private matchCache: MatchCache | null;
 
-  constructor(vocabulary: Map<string, VocabEntry>, config: UserConfig) {
+  constructor(
+    vocabulary: Map<string, VocabEntry>,
+    config: UserConfig,
+    matchCache: MatchCache | null = null
+  ) {
     this.vocabulary = vocabulary;
     this.config = config;
+    this.matchCache = matchCache;
   }
 
   /**
@@ -123,10 +133,61 @@ export class WordWiseAnnotator {
   /**
    * Find all vocabulary words in text that should be annotated
    * Returns: array of replacements sorted by position
-   * Now includes stem-based matching for conjugated verbs/adjectives
+   * Repeated text blocks (site chrome, SPA re-renders) are served from the
+   * match cache, skipping tokenisation and stem matching entirely.
    */
   private findReplacements(text: string): TextReplacement[] {
+    const { level, targetLanguage } = this.config;
+
+    const cached = this.matchCache?.get(text, level, targetLanguage);
+    if (cached) {
+      const replacements = this.resolveMatches(text, cached);
+      if (replacements) return replacements;
+    }
+
+    const matches = this.findMatches(text);
+    this.matchCache?.set(text, level, targetLanguage, matches);
+    return this.resolveMatches(text, matches) ?? [];
+  }
+
+  /**
+   * Expand compact matches into replacements with display translations.
+   * Returns null if a match does not fit the text (out of range, unsorted,
+   * overlapping, non-Hangul) or its entry id is missing from the current
+   * vocabulary, so the caller can fall back to a fresh match.
+   * buildAnnotatedHTML() relies on these ranges being sorted and disjoint.
+   */
+  private resolveMatches(text: string, matches: CachedReplacement[]): TextReplacement[] | null {
     const replacements: TextReplacement[] = [];
+    let lastEnd = 0;
+
+    for (const [start, end, entryId] of matches) {
+      if (!(Number.isInteger(start) && Number.isInteger(end))) return null;
+      if (!(lastEnd <= start && start < end && end <= text.length)) return null;
+      if (!HANGUL_WORD.test(text.slice(start, end))) return null;
+      lastEnd = end;
+
+      const entry = this.vocabulary.get(entryId);
+      if (!entry) return null;
+
+      replacements.push({
+        start,
+        end,
+        word: text.slice(start, end),  // Use the actual text word, not the dictionary form
+        translation: getTranslation(entry, this.config.targetLanguage),
+      });
+    }
+
+    return replacements;
+  }
+
+  /**
+   * Match vocabulary words in text
+   * Returns: compact [start, end, entryId] matches sorted by position
+   * Includes stem-based matching for conjugated verbs/adjectives
+   */
+  private findMatches(text: string): CachedReplacement[] {
+    const matches: CachedReplacement[] = [];
     
     // Track which positions have been matched to avoid overlaps
     const matched = new Set<number>();
@@ -188,14 +249,7 @@ export class WordWiseAnnotator {
         }
         
         if (!overlaps) {
-          const translation = getTranslation(entry, this.config.targetLanguage);
-          
-          replacements.push({
-            start: index,
-            end: index + word.length,
-            word,  // Use the actual text word, not the dictionary form
-            translation,
-          });
+          matches.push([index, index + word.length, entry.word]);
 
           // Mark positions as matched
           for (let i = index; i < index + word.length; i++) {
@@ -206,7 +260,7 @@ export class WordWiseAnnotator {
     }
 
     // Sort by start position
-    return replacements.sort((a, b) => a.start - b.start);
+    return matches.sort((a, b) => a[0] - b[0]);
   }
 
   /**
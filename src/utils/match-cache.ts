@@ -0,0 +1,206 @@
+import type { CachedReplacement, PersistedMatch, UserConfig } from '@/types';
+import { MESSAGE_TYPES } from '@/types';
+import { hashString } from './hash';
+
+// Defaults
+const MEMORY_LIMIT = 2000;  // entries kept in the in-memory LRU
+const FLUSH_DELAY_MS = 1000;
+
+export interface MatchCacheOptions {
+  /** Matching rules/vocab version — a new value invalidates every cached entry */
+  version: string;
+  /** Sync with the background store; false = memory only (dev builds, tests) */
+  persist?: boolean;
+  memoryLimit?: number;
+  flushDelayMs?: number;
+}
+
+/**
+ * Scope shared by all cache entries for one level/language/version combination.
+ * Used to preload only the entries relevant to the current settings.
+ */
+export function matchCacheScope(
+  level: UserConfig['level'],
+  language: UserConfig['targetLanguage'],
+  version: string
+): string {
+  return `${level}:${language}:${version}`;
+}
+
+/**
+ * Cache key = hash(scope + text). The text length is appended so that a hash
+ * collision would also need an identical length to return a wrong entry.
+ */
+export function matchCacheKey(text: string, scope: string): string {
+  return `${hashString(`${scope}\u0000${text}`)}:${text.length}`;
+}
+
+/**
+ * Cache of findReplacements() results keyed by text block content.
+ *
+ * Site chrome (menus, footers, sidebars) and SPA re-renders repeat the same
+ * text nodes across page loads, so matches are kept in an in-memory LRU and
+ * written through (batched) to the background script's IndexedDB store.
+ * Lookups are synchronous and only ever hit memory; preload() pulls entries
+ * from earlier visits into memory.
+ *
+ * Without an extension runtime (tests) it degrades to memory-only.
+ */
+export class MatchCache {
+  private memory = new Map<string, CachedReplacement[]>();
+  private pending = new Map<string, PersistedMatch>();
+  private touched = new Set<string>(); // in-memory keys whose lastUsed was refreshed this session
+  private flushTimer: ReturnType<typeof setTimeout> | null = null;
+  private version: string;
+  private persist: boolean;
+  private memoryLimit: number;
+  private flushDelayMs: number;
+
+  constructor(options: MatchCacheOptions) {
+    this.version = options.version;
+    this.persist = (options.persist ?? true) && typeof chrome !== 'undefined' && !!chrome.runtime?.id;
+    this.memoryLimit = options.memoryLimit ?? MEMORY_LIMIT;
+    this.flushDelayMs = options.flushDelayMs ?? FLUSH_DELAY_MS;
+  }
+
+  /**
+   * Number of entries currently held in memory
+   */
+  get size(): number {
+    return this.memory.size;
+  }
+
+  /**
+   * Load the most recently used persisted entries for a level/language
+   * into the free memory slots. Preloaded entries go to the LRU end: anything
+   * cached since startup belongs to the current page and must not be evicted
+   * by a preload that lands late.
+   */
+  async preload(
+    level: UserConfig['level'],
+    language: UserConfig['targetLanguage']
+  ): Promise<void> {
+    if (!this.persist) return;
+
+    const scope = matchCacheScope(level, language, this.version);
+    let records: PersistedMatch[];
+
+    try {
+      records = (await chrome.runtime.sendMessage({
+        type: MESSAGE_TYPES.MATCH_CACHE_PRELOAD,
+        scope,
+        limit: this.memoryLimit,
+      })) ?? [];
+    } catch (error) {
+      console.error('WordWise Korean: Failed to preload match cache', error);
+      return;
+    }
+
+    // Records arrive newest first; keep the newest that fit in the free slots
+    const slots = Math.max(0, this.memoryLimit - this.memory.size);
+    const fresh = records.filter(record => !this.memory.has(record.key)).slice(0, slots);
+
+    // Rebuild as preloaded (oldest → newest) followed by the existing entries
+    const merged = new Map<string, CachedReplacement[]>();
+    for (let i = fresh.length - 1; i >= 0; i--) {
+      merged.set(fresh[i].key, fresh[i].replacements);
+    }
+    for (const [key, replacements] of this.memory) {
+      merged.set(key, replacements);
+    }
+    this.memory = merged;
+
+    console.log(`WordWise Korean: Preloaded ${fresh.length} cached text blocks`);
+  }
+
+  /**
+   * Look up cached matches for a text block. Returns undefined on a miss.
+   * Callers must validate the result against the text before using it.
+   */
+  get(
+    text: string,
+    level: UserConfig['level'],
+    language: UserConfig['targetLanguage']
+  ): CachedReplacement[] | undefined {
+    const scope = matchCacheScope(level, language, this.version);
+    const key = matchCacheKey(text, scope);
+    const replacements = this.memory.get(key);
+    if (!replacements) return undefined;
+
+    // Move to the MRU end; refresh the persisted lastUsed once per session
+    this.memory.delete(key);
+    this.memory.set(key, replacements);
+    if (!this.touched.has(key)) {
+      this.schedulePersist({ key, scope, lastUsed: Date.now(), replacements });
+    }
+
+    return replacements;
+  }
+
+  /**
+   * Store matches for a text block (an empty list is a valid "no matches" entry)
+   */
+  set(
+    text: string,
+    level: UserConfig['level'],
+    language: UserConfig['targetLanguage'],
+    replacements: CachedReplacement[]
+  ): void {
+    const scope = matchCacheScope(level, language, this.version);
+    const key = matchCacheKey(text, scope);
+
+    this.memory.delete(key);
+    this.memory.set(key, replacements);
+    this.evict();
+    this.schedulePersist({ key, scope, lastUsed: Date.now(), replacements });
+  }
+
+  /**
+   * Send all pending entries to the background store
+   */
+  async flush(): Promise<void> {
+    if (this.flushTimer) {
+      clearTimeout(this.flushTimer);
+      this.flushTimer = null;
+    }
+    if (!this.persist || this.pending.size === 0) return;
+
+    const records = Array.from(this.pending.values());
+    this.pending.clear();
+
+    try {
+      await chrome.runtime.sendMessage({ type: MESSAGE_TYPES.MATCH_CACHE_PUT, records });
+    } catch (error) {
+      // Extension reloaded or updated — this content script can no longer reach it
+      console.error('WordWise Korean: Failed to persist match cache', error);
+      this.persist = false;
+    }
+  }
+
+  /**
+   * Drop least recently used entries beyond memoryLimit
+   */
+  private evict(): void {
+    while (this.memory.size > this.memoryLimit) {
+      const oldest = this.memory.keys().next().value as string;
+      this.memory.delete(oldest);
+      this.touched.delete(oldest);
+    }
+  }
+
+  /**
+   * Queue an entry for the next batched write
+   */
+  private schedulePersist(record: PersistedMatch): void {
+    if (!this.persist) return;
+
+    this.touched.add(record.key);
+    this.pending.set(record.key, record);
+    if (this.flushTimer) return;
+
+    this.flushTimer = setTimeout(() => {
+      this.flushTimer = null;
+      this.flush();
+    }, this.flushDelayMs);
+  }
+}
@@ -0,0 +1,121 @@
+import type { PersistedMatch } from '@/types';
+
+// IndexedDB layout (extension origin — only reachable from the background script)
+const DB_NAME = 'wordwise-korean';
+const DB_VERSION = 1;
+const STORE_NAME = 'match-cache';
+const SCOPE_INDEX = 'scope-lastUsed';
+const LAST_USED_INDEX = 'lastUsed';
+
+const PERSIST_LIMIT = 5000; // entries kept on disk (oldest evicted first)
+
+function requestToPromise<T>(request: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+function transactionDone(tx: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+    tx.onabort = () => reject(tx.error);
+  });
+}
+
+/**
+ * Persistent side of the match cache, owned by the background script.
+ *
+ * Kept in the extension's own IndexedDB rather than the page origin, so
+ * sites can neither detect the cache nor write entries into it. Content
+ * scripts reach it through MESSAGE_TYPES.MATCH_CACHE_* messages.
+ */
+export class MatchStore {
+  private db: Promise<IDBDatabase> | null = null;
+  private persistLimit: number;
+
+  constructor(persistLimit = PERSIST_LIMIT) {
+    this.persistLimit = persistLimit;
+  }
+
+  /**
+   * Load the most recently used entries for a scope, newest first
+   */
+  async loadRecent(scope: string, limit: number): Promise<PersistedMatch[]> {
+    const db = await this.open();
+    const records: PersistedMatch[] = [];
+
+    const tx = db.transaction(STORE_NAME, 'readonly');
+    const range = IDBKeyRange.bound([scope, -Infinity], [scope, Infinity]);
+    const cursorRequest = tx.objectStore(STORE_NAME).index(SCOPE_INDEX).openCursor(range, 'prev');
+
+    await new Promise<void>((resolve, reject) => {
+      cursorRequest.onsuccess = () => {
+        const cursor = cursorRequest.result;
+        if (!cursor || records.length >= limit) {
+          resolve();
+          return;
+        }
+        records.push(cursor.value as PersistedMatch);
+        cursor.continue();
+      };
+      cursorRequest.onerror = () => reject(cursorRequest.error);
+    });
+
+    return records;
+  }
+
+  /**
+   * Write entries in one transaction and prune the store to persistLimit
+   */
+  async put(records: PersistedMatch[]): Promise<void> {
+    if (records.length === 0) return;
+
+    const db = await this.open();
+    const tx = db.transaction(STORE_NAME, 'readwrite');
+    const done = transactionDone(tx);
+    const store = tx.objectStore(STORE_NAME);
+
+    for (const record of records) {
+      store.put(record);
+    }
+
+    let excess = (await requestToPromise(store.count())) - this.persistLimit;
+    if (excess > 0) {
+      const cursorRequest = store.index(LAST_USED_INDEX).openCursor();
+      cursorRequest.onsuccess = () => {
+        const cursor = cursorRequest.result;
+        if (!cursor || excess <= 0) return;
+        cursor.delete();
+        excess--;
+        cursor.continue();
+      };
+    }
+
+    await done;
+  }
+
+  /**
+   * Open (or create/upgrade) the database once; retried on the next call if it fails
+   */
+  private open(): Promise<IDBDatabase> {
+    if (!this.db) {
+      const request = indexedDB.open(DB_NAME, DB_VERSION);
+      request.onupgradeneeded = (event) => {
+        const db = request.result;
+        // One step per schema version so future DB_VERSION bumps stay additive
+        if (event.oldVersion < 1) {
+          const store = db.createObjectStore(STORE_NAME, { keyPath: 'key' });
+          store.createIndex(SCOPE_INDEX, ['scope', 'lastUsed']);
+          store.createIndex(LAST_USED_INDEX, 'lastUsed');
+        }
+      };
+      this.db = requestToPromise(request);
+      this.db.catch(() => {
+        this.db = null;
+      });
+    }
+    return this.db;
+  }
+}
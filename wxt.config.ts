@@ -1,5 +1,25 @@
 import { defineConfig } from 'wxt';
 import vue from '@vitejs/plugin-vue';
+import { createHash } from 'node:crypto';
+import { readFileSync } from 'node:fs';
+import { resolve } from 'node:path';
+
+// Files that decide which words get matched. Their hash versions the
+// persistent match cache, so a new build never serves stale matches.
+const MATCHING_SOURCES = [
+  'src/assets/topik-vocab.json',
+  'src/utils/vocabulary-loader.ts',
+  'src/utils/korean-stem.ts',
+  'src/utils/annotator.ts',
+];
+
+function matchCacheVersion(): string {
+  const hash = createHash('sha256');
+  for (const file of MATCHING_SOURCES) {
+    hash.update(readFileSync(resolve(__dirname, file)));
+  }
+  return hash.digest('hex').slice(0, 12);
+}
 
 // See https://wxt.dev/api/config.html
 export default defineConfig({
@@ -21,5 +41,8 @@ export default defineConfig({
   },
   vite: () => ({
     plugins: [vue()],
+    define: {
+      __MATCH_CACHE_VERSION__: JSON.stringify(matchCacheVersion()),
+    },
   }),
 });